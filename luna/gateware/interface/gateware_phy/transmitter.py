@@ -520,10 +520,10 @@ class TxPipeline(Elaboratable):
         nrzi_dat = Signal()
         nrzi_oe = Signal()
 
-        # Cross the data from the 12MHz domain to the 48MHz domain
-        cdc_dat = FFSynchronizer(self.fit_dat, nrzi_dat, o_domain="usb_io", stages=3)
-        cdc_oe  = FFSynchronizer(self.fit_oe, nrzi_oe, o_domain="usb_io", stages=3)
-        m.submodules += [cdc_dat, cdc_oe]
+        # Cross the data from the 12MHz domain to the 48MHz domain;
+        # both bits share a single synchronizer chain.
+        m.submodules.cdc = FFSynchronizer(Cat(self.fit_dat, self.fit_oe), Cat(nrzi_dat, nrzi_oe),
+            o_domain="usb_io", stages=3)
 
         m.d.comb += [
             nrzi.i_valid.eq(self.i_bit_strobe),
@@ -94,6 +94,10 @@ class USBAnalyzer(Elaboratable):
         fifo_count      = Signal.like(mem_read_port.addr, reset=0)
         fifo_new_data   = Signal()
 
+        # Strobes for data entering and leaving the FIFO.
+        data_pop        = Signal()
+        data_push       = Signal()
+
         # Current receive status.
         packet_size     = Signal(16)
 
@@ -105,6 +109,9 @@ class USBAnalyzer(Elaboratable):
             # We have data ready whenever there's data in the FIFO.
             self.stream.valid    .eq((fifo_count != 0) & self.idle),
 
+            # Data is popped whenever our consumer accepts a valid byte.
+            data_pop             .eq(self.stream.ready & self.stream.valid),
+
             # Our data_out is always the output of our read port...
             self.stream.payload  .eq(mem_read_port.data),
 
@@ -113,7 +120,7 @@ class USBAnalyzer(Elaboratable):
         ]
 
         # Once our consumer has accepted our current data, move to the next address.
-        with m.If(self.stream.ready & self.stream.valid):
+        with m.If(data_pop):
             m.d.usb += read_location.eq(read_location + 1)
             m.d.comb += mem_read_port.addr.eq(read_location + 1)
 
@@ -127,12 +134,7 @@ class USBAnalyzer(Elaboratable):
         #
         fifo_full = (fifo_count == self.mem_size)
 
-        data_pop   = Signal()
-        data_push  = Signal()
-        m.d.comb += [
-            data_pop   .eq(self.stream.ready & self.stream.valid),
-            data_push  .eq(fifo_new_data & ~fifo_full)
-        ]
+        m.d.comb += data_push.eq(fifo_new_data & ~fifo_full)
 
         # If we have both a read and a write, don't update the count,
         # as we've both added one and subtracted one.